@@ -1,28 +1,45 @@
-from fastapi import APIRouter, Query, HTTPException, Depends
-from datetime import date, timedelta, datetime, timezone
-from typing import Optional
-from app.services.cycle import get_day_info
+from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import ORJSONResponse
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Optional
+from fastapi_cache.decorator import cache
+from app.services.cycle import MAX_DAY_RANGE, get_day_info, get_day_info_range
 from app.models import DayInfo
 import logging
 
 router = APIRouter(prefix="/cycle", tags=["cycle"])
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-def get_current_utc_datetime() -> datetime:
-    """Gets the current UTC datetime."""
-    return datetime.now(timezone.utc)
+# Default last period start relative to today, shared instead of rebuilt per request
+_ANCHOR_DELTA = timedelta(days=28)
 
-@router.get("/day-info", response_model=DayInfo)
+def resolve_dates(query_date: date | None, last_period_start_date: date | None) -> tuple[date, date]:
+    """Resolves the target and anchor dates, applying the defaults relative to today (UTC)."""
+    if query_date and last_period_start_date:
+        return query_date, last_period_start_date
+    today = datetime.now(timezone.utc).date()
+    target = query_date or today
+    anchor = last_period_start_date or (today - _ANCHOR_DELTA)
+    return target, anchor
+
+def day_info_key_builder(_func: Any, namespace: str = "", *, kwargs: dict[str, Any], **_: Any) -> str:
+    """
+    Builds the cache key for day_info_api from the resolved query values only,
+    so requests relying on "today" defaults roll over to a new key each day.
+    """
+    target, anchor = resolve_dates(kwargs["query_date"], kwargs["last_period_start_date"])
+    return f"{namespace}:{target.toordinal()}:{anchor.toordinal()}:{kwargs['cycle_length']}:{kwargs['period_length']}:{int(kwargs['include_details'])}"
+
+@router.get("/day-info", response_model=DayInfo, response_class=ORJSONResponse, response_model_exclude_none=True)
+@cache(expire=3600, namespace="day-info", key_builder=day_info_key_builder)
 async def day_info_api(
     query_date: Optional[date] = Query(None, description="The date to check cycle info for (YYYY-MM-DD). Default: today."),
     last_period_start_date: Optional[date] = Query(None, description="The start date of the last period (YYYY-MM-DD)."),
     cycle_length: int = Query(28, ge=21, le=35, description="Approximate total cycle length in days."),
     period_length: int = Query(5, ge=1, description="Number of menstrual (period) days."),
     include_details: bool = Query(False, description="If true, includes textual phase details in response."),
-    current_utc_datetime: datetime = Depends(get_current_utc_datetime)
 ):
     """
     Retrieves information about a specific date within a menstrual cycle.
@@ -33,7 +50,6 @@ async def day_info_api(
         cycle_length: Approximate total cycle length in days.
         period_length: Number of menstrual (period) days.
         include_details: If true, includes textual phase details in response.
-        current_utc_datetime: current UTC datetime (used for timezone awareness)
 
     Returns:
         A dictionary containing date, cycle day, phase, and optional phase details.
@@ -41,10 +57,12 @@ async def day_info_api(
     Raises:
         HTTPException: If input values are invalid or if an error occurs during calculation.
     """
-    target = query_date or current_utc_datetime.date()
-    anchor = last_period_start_date or (current_utc_datetime.date() - timedelta(days=28))
+    target, anchor = resolve_dates(query_date, last_period_start_date)
 
-    logger.info(f"Request received: query_date={query_date}, last_period_start_date={last_period_start_date}, cycle_length={cycle_length}, period_length={period_length}, include_details={include_details}")
+    logger.info(
+        "Request received: query_date=%s last_period_start_date=%s cycle_length=%s period_length=%s include_details=%s",
+        query_date, last_period_start_date, cycle_length, period_length, include_details
+    )
 
     if last_period_start_date and last_period_start_date > target:
         logger.warning("Last period start date in the future.")
@@ -53,8 +71,50 @@ async def day_info_api(
     try:
         return get_day_info(target, anchor, cycle_length, period_length, include_details)
     except ValueError as e:
-        logger.error(f"ValueError during calculation: {e}")
+        logger.error("ValueError during calculation: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.exception("An unexpected error occurred.") #Logs the full stack trace.
         raise HTTPException(status_code=500, detail="An internal server error occurred.")
+
+@router.get("/day-range", response_model=list[DayInfo], response_class=ORJSONResponse, response_model_exclude_none=True)
+async def day_range_api(
+    start_date: date = Query(..., description="The first date of the range (YYYY-MM-DD)."),
+    end_date: date = Query(..., description=f"The last date of the range, inclusive (YYYY-MM-DD). The range spans at most {MAX_DAY_RANGE} days."),
+    last_period_start_date: date | None = Query(None, description="The start date of the last period (YYYY-MM-DD)."),
+    cycle_length: int = Query(28, ge=21, le=35, description="Approximate total cycle length in days."),
+    period_length: int = Query(5, ge=1, description="Number of menstrual (period) days."),
+    include_details: bool = Query(False, description="If true, includes textual phase details in response."),
+) -> list[DayInfo]:
+    """
+    Retrieves cycle information for every date in a range, e.g. to render a calendar.
+
+    Args:
+        start_date: The first date of the range (YYYY-MM-DD).
+        end_date: The last date of the range, inclusive (YYYY-MM-DD).
+        last_period_start_date: The start date of the last period (YYYY-MM-DD).
+        cycle_length: Approximate total cycle length in days.
+        period_length: Number of menstrual (period) days.
+        include_details: If true, includes textual phase details in response.
+
+    Returns:
+        A list with the date, cycle day, phase, and optional phase details of each date.
+
+    Raises:
+        HTTPException: If input values are invalid or if an error occurs during calculation.
+    """
+    _, anchor = resolve_dates(start_date, last_period_start_date)
+
+    logger.info(
+        "Request received: start_date=%s end_date=%s last_period_start_date=%s cycle_length=%s period_length=%s include_details=%s",
+        start_date, end_date, last_period_start_date, cycle_length, period_length, include_details
+    )
+
+    try:
+        return get_day_info_range(start_date, end_date, anchor, cycle_length, period_length, include_details)
+    except ValueError as e:
+        logger.error("ValueError during calculation: %s", e)
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("An unexpected error occurred.") #Logs the full stack trace.
+        raise HTTPException(status_code=500, detail="An internal server error occurred.")
@@ -0,0 +1,28 @@
+from collections import OrderedDict
+
+from fastapi_cache.backends.inmemory import InMemoryBackend, Value
+
+
+class LRUInMemoryBackend(InMemoryBackend):
+    """
+    In-memory cache backend that evicts the least recently used entry once
+    ``max_size`` keys are stored, so the process memory stays bounded.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        # The parent declares the store at class level; keep one per instance
+        self._store: OrderedDict[str, Value] = OrderedDict()
+
+    def _get(self, key: str) -> Value | None:
+        v = super()._get(key)
+        if v:
+            self._store.move_to_end(key)
+        return v
+
+    async def set(self, key: str, value: bytes, expire: int | None = None) -> None:
+        async with self._lock:
+            self._store[key] = Value(value, self._now + (expire or 0))
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
@@ -1,16 +1,133 @@
+import hashlib
+import logging
+import logging.config
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, time, timedelta, timezone
+from operator import itemgetter
+from urllib.parse import parse_qsl, urlencode
+
 import sentry_sdk
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.routing import APIRoute
+from fastapi_cache import FastAPICache
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from uvicorn.config import LOGGING_CONFIG
 
 from app.api.main import api_router
+from app.core.cache import LRUInMemoryBackend
 from app.core.config import settings
 
+# Configure logging once, on the root logger, with uvicorn's formatter and stream (plus the
+# logger name). Only root is configured so module loggers keep their handlers and propagate,
+# and the uvicorn loggers (which don't propagate) keep any custom --log-config
+logging.config.dictConfig(
+    {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "formatters": {
+            "default": {
+                "()": "uvicorn.logging.DefaultFormatter",
+                "fmt": "%(levelprefix)s %(name)s: %(message)s",
+                "use_colors": None,
+            },
+        },
+        "handlers": {"default": LOGGING_CONFIG["handlers"]["default"]},
+        "root": {"handlers": ["default"], "level": "INFO"},
+    }
+)
+
 
 def custom_generate_unique_id(route: APIRoute) -> str:
     return f"{route.tags[0]}-{route.name}"
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    FastAPICache.init(LRUInMemoryBackend(max_size=10_000), prefix="cycle")
+    yield
+
+
+class DayInfoETagMiddleware:
+    """
+    Adds an ETag to successful GET responses of the day-info endpoint and answers
+    matching If-None-Match requests with 304 Not Modified without calling the route.
+    A wildcard If-None-Match is answered with 304 only once the route returns 200.
+
+    The response only depends on the query parameters and, through the defaults,
+    on the current date, so the ETag is a hash of both. When a date parameter is
+    left to its default, max-age is capped at midnight UTC so clients revalidate once
+    the date changes.
+    """
+
+    def __init__(self, app: ASGIApp, path: str, max_age: int = 3600) -> None:
+        self.app = app
+        self.path = path
+        self.max_age = max_age
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or scope["path"] != self.path
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Sort by key only: the order of a repeated key's values picks the one used
+        query = sorted(
+            parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True),
+            key=itemgetter(0),
+        )
+        now = datetime.now(timezone.utc)
+        canonical = f"{urlencode(query)}|{now.date().isoformat()}"
+        etag = f'"{hashlib.blake2b(canonical.encode(), digest_size=8).hexdigest()}"'
+
+        max_age = self.max_age
+        params = dict(query)
+        if not (params.get("query_date") and params.get("last_period_start_date")):
+            midnight = datetime.combine(now.date() + timedelta(days=1), time.min, timezone.utc)
+            max_age = min(max_age, int((midnight - now).total_seconds()))
+        cache_control = f"private, max-age={max_age}"
+
+        if_none_match = Headers(scope=scope).get("if-none-match", "").strip()
+        # "*" only matches an existing representation, so it can't be answered
+        # before the route has validated the request and produced a 200
+        wildcard = if_none_match == "*"
+        if not wildcard and etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ):
+            response = Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": cache_control},
+            )
+            await response(scope, receive, send)
+            return
+
+        not_modified = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal not_modified
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                if wildcard:
+                    not_modified = True
+                    message = {"type": "http.response.start", "status": 304, "headers": []}
+                headers = MutableHeaders(scope=message)
+                headers["ETag"] = etag
+                headers["Cache-Control"] = cache_control
+            elif message["type"] == "http.response.body" and not_modified:
+                if message.get("more_body", False):
+                    return
+                message = {"type": "http.response.body", "body": b""}
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
@@ -18,8 +135,12 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+app.add_middleware(DayInfoETagMiddleware, path=f"{settings.API_V1_STR}/cycle/day-info")
+
 # Set all CORS enabled origins
 if settings.all_cors_origins:
     app.add_middleware(
@@ -1,14 +1,18 @@
 from datetime import date
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 class PhaseDetails(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     energy: str
     emotional: str
     nutrition: str
     exercise: str
 
 class DayInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     date: date
     cycleDay: int
     phase: str
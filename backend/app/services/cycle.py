@@ -1,27 +1,26 @@
-from datetime import date, timedelta, datetime, timezone
-from typing import Dict, Any
-from app.models import PhaseDetails, DayInfo
+from datetime import date
+from functools import lru_cache
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+from app.models.cycle import PhaseDetails, DayInfo
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-
-def get_current_utc_datetime() -> datetime:
-    """Gets the current UTC datetime."""
-    return datetime.now(timezone.utc)
-
-current_utc_datetime = get_current_utc_datetime()
+logger.addHandler(logging.NullHandler())
 
 # Constants
 DEFAULT_CYCLE_LENGTH = 28
 DEFAULT_PERIOD_LENGTH = 5
-LAST_PERIOD_START = (current_utc_datetime.date() - timedelta(days=28))
 
 MIN_CYCLE_LENGTH = 21
 MAX_CYCLE_LENGTH = 35
+DEFAULT_LUTEAL_PHASE_LENGTH = 14
+
+# Longest span get_day_info_range computes in one call; callers chunk longer ranges
+MAX_DAY_RANGE = 366
 
-VALID_PHASES = {"menstrual", "follicular", "ovulatory", "luteal"}
+PHASES = ("menstrual", "follicular", "ovulatory", "luteal")
 
 # Predefined textual details for each phase
 PHASE_DETAILS = {
@@ -51,9 +50,22 @@ PHASE_DETAILS = {
     ),
 }
 
+# Serialized once at import; get_day_info serves copies of these instead of calling model_dump() per
+# request. Read-only, since they are shared by every cached result.
+PHASE_DETAILS_DUMPED: dict[str, Mapping[str, Any]] = {k: MappingProxyType(v.model_dump()) for k, v in PHASE_DETAILS.items()}
+
 def clamp_cycle_length(value: int) -> int:
     return max(MIN_CYCLE_LENGTH, min(value, MAX_CYCLE_LENGTH))
 
+def _reduce_cycle_day(diff: int, clamped: int) -> int:
+    """1-based cycle day for a non-negative day offset from the period start."""
+    # Most targets fall within the first two cycles, so skip the modulo there
+    if diff < clamped:
+        return diff + 1
+    if diff < (clamped << 1):
+        return diff - clamped + 1
+    return (diff % clamped) + 1
+
 def get_cycle_day(target_date: date, last_period_start_date: date, cycle_length: int) -> int:
     """
     Calculates the cycle day for a given target date.
@@ -67,20 +79,39 @@ def get_cycle_day(target_date: date, last_period_start_date: date, cycle_length:
         The cycle day (1-based).
 
     Raises:
-        ValueError: If input values are invalid.
+        ValueError: If cycle_length is not positive (checked only when running without -O).
+
+    Note:
+        Inputs are expected to be validated by the caller; in particular target_date must not
+        be before last_period_start_date (get_day_info checks this).
     """
-    if not isinstance(target_date, date) or not isinstance(last_period_start_date, date):
-        raise ValueError("target_date and last_period_start_date must be date objects.")
-    if cycle_length <= 0:
-        raise ValueError("cycle_length must be a positive integer.")
-    if target_date < last_period_start_date:
-        raise ValueError("Target date can not be before the last period start date.")
+    if __debug__:
+        if cycle_length <= 0:
+            raise ValueError("cycle_length must be a positive integer.")
 
-    clamped = clamp_cycle_length(cycle_length)
-    diff = (target_date - last_period_start_date).days
-    return (diff % clamped) + 1
+    diff = target_date.toordinal() - last_period_start_date.toordinal()
+    return _reduce_cycle_day(diff, clamp_cycle_length(cycle_length))
 
-def get_cycle_phase(cycle_day: int, cycle_length: int, period_length: int, luteal_phase_length: int = 14) -> str:
+def _compute_phase(cycle_day: int, clamped: int, period_length: int, luteal_phase_length: int) -> str:
+    """Phase for a cycle day, given the already clamped cycle length."""
+    if cycle_day <= period_length:
+        return "menstrual"
+
+    luteal_start = clamped - luteal_phase_length
+    # The luteal phase takes precedence over the three-day ovulatory window starting the day
+    # before it, so only that single day is ovulatory
+    return PHASES[3 if cycle_day >= luteal_start else (2 if cycle_day == luteal_start - 1 else 1)]
+
+# Phase of every cycle day (index cycle_day - 1) for each clamped cycle length and period length,
+# assuming the default luteal phase length. Used by get_day_info_range to resolve a whole span with
+# one lookup; single days are cheaper to compute directly than to look up.
+_PHASE_LUT: dict[tuple[int, int], tuple[str, ...]] = {
+    (cl, pl): tuple(_compute_phase(d, cl, pl, DEFAULT_LUTEAL_PHASE_LENGTH) for d in range(1, cl + 1))
+    for cl in range(MIN_CYCLE_LENGTH, MAX_CYCLE_LENGTH + 1)
+    for pl in range(1, cl + 1)
+}
+
+def get_cycle_phase(cycle_day: int, cycle_length: int, period_length: int, luteal_phase_length: int = DEFAULT_LUTEAL_PHASE_LENGTH) -> str:
     """
     Estimates the phase of the menstrual cycle based on the cycle day, length, and period length.
 
@@ -94,37 +125,39 @@ def get_cycle_phase(cycle_day: int, cycle_length: int, period_length: int, lutea
         The estimated phase of the menstrual cycle ("menstrual", "follicular", "ovulatory", or "luteal").
 
     Raises:
-        ValueError: If any input value is invalid.
+        ValueError: If period_length is longer than cycle_length, or (when running without -O)
+            if any input value is not positive.
 
     Disclaimer:
         This is a simplified model and may not accurately represent individual menstrual cycles.
         It should not be used for medical purposes.
     """
-
-    if cycle_day <= 0 or cycle_length <= 0 or period_length <= 0 or luteal_phase_length <= 0:
-        raise ValueError("Cycle day, cycle length, period length, and luteal phase length must be positive integers.")
+    if __debug__:
+        if cycle_day <= 0 or cycle_length <= 0 or period_length <= 0 or luteal_phase_length <= 0:
+            raise ValueError("Cycle day, cycle length, period length, and luteal phase length must be positive integers.")
+    # Not covered by the API's Query constraints, so this one is always enforced
     if period_length > cycle_length:
         raise ValueError("Period length cannot be longer than cycle length.")
-    clamped = clamp_cycle_length(cycle_length)
 
-    if cycle_day <= period_length:
-        return "menstrual"
-
-    luteal_start = clamped - luteal_phase_length
-    if cycle_day >= luteal_start:
-        return "luteal"
+    return _compute_phase(cycle_day, clamp_cycle_length(cycle_length), period_length, luteal_phase_length)
 
-    ovulation_day = clamped - luteal_phase_length - 1
-    if ovulation_day <= cycle_day <= ovulation_day + 2:
-        return "ovulatory"
+@lru_cache(maxsize=4096)
+def _get_day_info_cached(target_ordinal: int, anchor_ordinal: int, cycle_length: int, period_length: int, include_details: bool) -> dict[str, Any]:
+    """
+    Computes the DayInfo fields for the given date ordinals.
 
-    return "follicular"
+    Results are memoized on the plain int/bool arguments; callers must not mutate the returned dict,
+    and details is the shared read-only PHASE_DETAILS_DUMPED entry.
+    """
+    cycle_day = _reduce_cycle_day(target_ordinal - anchor_ordinal, clamp_cycle_length(cycle_length))
+    phase = get_cycle_phase(cycle_day, cycle_length, period_length)
 
-def get_phase_details(phase: str) -> PhaseDetails:
-    if phase not in VALID_PHASES:
-        logger.warning(f"Unexpected phase encountered: {phase}")
-        return PHASE_DETAILS["follicular"] #returning default
-    return PHASE_DETAILS[phase]
+    return {
+        "date": date.fromordinal(target_ordinal),
+        "cycleDay": cycle_day,
+        "phase": phase,
+        "details": PHASE_DETAILS_DUMPED[phase] if include_details else None,
+    }
 
 def get_day_info(target_date: date, last_period_start_date: date, cycle_length: int, period_length: int, include_details: bool = False) -> DayInfo:
     """
@@ -139,34 +172,88 @@ def get_day_info(target_date: date, last_period_start_date: date, cycle_length:
 
     Returns:
         A DayInfo object containing date, cycle day, phase, and optional phase details.
+        details is a fresh dict owned by the caller.
 
     Raises:
         ValueError: If input values are invalid or if an error occurs during phase calculation.
+
+    Note:
+        Argument types and ranges are assumed to be enforced by the caller (the API route's
+        typed Query parameters); the positivity checks only run without -O.
     """
-    if not isinstance(target_date, date) or not isinstance(last_period_start_date, date):
-        raise ValueError("target_date and last_period_start_date must be date objects.")
-    if cycle_length <= 0 or period_length <= 0:
-        raise ValueError("cycle_length and period_length must be positive integers.")
+    if __debug__:
+        if cycle_length <= 0 or period_length <= 0:
+            raise ValueError("cycle_length and period_length must be positive integers.")
     if target_date < last_period_start_date:
         raise ValueError("Target date can not be before the last period start date.")
 
-    try:
-        cycle_day = get_cycle_day(target_date, last_period_start_date, cycle_length)
-        phase = get_cycle_phase(cycle_day, cycle_length, period_length)
+    fields = dict(_get_day_info_cached(
+        target_date.toordinal(),
+        last_period_start_date.toordinal(),
+        cycle_length,
+        period_length,
+        include_details
+    ))
+    if fields["details"] is not None:
+        fields["details"] = dict(fields["details"])
 
-        day_info = DayInfo(
-            date=target_date.isoformat(),
-            cycleDay=cycle_day,
-            phase=phase
-        )
+    # The fields come from validated inputs, so skip re-validating them
+    day_info = DayInfo.model_construct(**fields)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("get_day_info result: %s", day_info)
+    return day_info
+
+def get_day_info_range(start_date: date, end_date: date, last_period_start_date: date, cycle_length: int, period_length: int, include_details: bool = False) -> list[DayInfo]:
+    """
+    Retrieves information about every date from start_date to end_date (inclusive).
+
+    Args:
+        start_date: The first date to retrieve information for.
+        end_date: The last date to retrieve information for.
+        last_period_start_date: The date of the start of the last menstrual period.
+        cycle_length: The length of the menstrual cycle in days.
+        period_length: The length of the menstrual period in days.
+        include_details: Whether to include detailed phase information.
 
-        if include_details:
-            day_info.details = get_phase_details(phase).model_dump()
+    Returns:
+        A list of DayInfo objects, one per date in the range. Each details is a fresh dict.
 
-        logger.info(f"get_day_info result: {day_info}")
-        return day_info
+    Raises:
+        ValueError: If the range is empty, longer than MAX_DAY_RANGE days or starts before
+            last_period_start_date, or if period_length is longer than cycle_length.
+    """
+    if __debug__:
+        if cycle_length <= 0 or period_length <= 0:
+            raise ValueError("cycle_length and period_length must be positive integers.")
+    if end_date < start_date:
+        raise ValueError("End date can not be before the start date.")
+    if start_date < last_period_start_date:
+        raise ValueError("Start date can not be before the last period start date.")
+    if period_length > cycle_length:
+        raise ValueError("Period length cannot be longer than cycle length.")
+
+    start_ordinal = start_date.toordinal()
+    end_ordinal = end_date.toordinal()
+    if end_ordinal - start_ordinal >= MAX_DAY_RANGE:
+        raise ValueError(f"The range can not span more than {MAX_DAY_RANGE} days.")
+
+    clamped = clamp_cycle_length(cycle_length)
+    phases = _PHASE_LUT.get((clamped, period_length))
+    if phases is None:
+        phases = tuple(_compute_phase(d, clamped, period_length, DEFAULT_LUTEAL_PHASE_LENGTH) for d in range(1, clamped + 1))
+
+    # Reduce only the first offset, then step the cycle day along with the date
+    cycle_day = _reduce_cycle_day(start_ordinal - last_period_start_date.toordinal(), clamped)
+    days = []
+    for ordinal in range(start_ordinal, end_ordinal + 1):
+        phase = phases[cycle_day - 1]
+        days.append(DayInfo.model_construct(
+            date=date.fromordinal(ordinal),
+            cycleDay=cycle_day,
+            phase=phase,
+            details=dict(PHASE_DETAILS_DUMPED[phase]) if include_details else None,
+        ))
+        cycle_day = cycle_day + 1 if cycle_day < clamped else 1
 
-    except ValueError as e:
-        raise ValueError(f"Error calculating day info: {e}")
-    except Exception as e:
-        raise Exception(f"An unexpected error occurred: {e}")
+    return days
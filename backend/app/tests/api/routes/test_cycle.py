@@ -1,31 +1,128 @@
-from datetime import date
+from datetime import date, datetime, time, timezone, tzinfo
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
 
 def test_day_info_valid(client):
-    response = client.get("/cycle/day-info?query_date=2024-03-10&cycle_length=28&period_length=5&include_details=true")
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-info?query_date=2024-03-10&last_period_start_date=2024-03-01&cycle_length=28&period_length=5&include_details=true")
     assert response.status_code == 200
     data = response.json()
     assert "cycleDay" in data
     assert "phase" in data
     assert "date" in data
+    assert set(data["details"]) == {"energy", "emotional", "nutrition", "exercise"}
 
 def test_day_info_default_values(client):
-    response = client.get("/cycle/day-info")
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-info")
     assert response.status_code == 200
     data = response.json()
     assert "cycleDay" in data
     assert "phase" in data
     assert "date" in data
+    assert "details" not in data
 
 def test_invalid_cycle_length(client):
-    response = client.get("/cycle/day-info?cycle_length=40")  # Invalid (above 35)
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-info?cycle_length=40")  # Invalid (above 35)
     assert response.status_code == 422  # FastAPI's auto-validation
 
 def test_invalid_period_length(client):
-    response = client.get("/cycle/day-info?period_length=0")  # Invalid (less than 1)
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-info?period_length=0")  # Invalid (less than 1)
     assert response.status_code == 422  # FastAPI validation
 
 def test_future_last_period_start_date(client):
     future_date = (date.today().replace(year=date.today().year + 1)).isoformat()
-    response = client.get(f"/cycle/day-info?last_period_start_date={future_date}")
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-info?last_period_start_date={future_date}")
     assert response.status_code == 400  # Our custom validation
     assert response.json()["detail"] == "The last period start date cannot be in the future."
+
+def test_day_info_cached(client: TestClient) -> None:
+    url = f"{settings.API_V1_STR}/cycle/day-info?query_date=2024-05-01&last_period_start_date=2024-04-20&cycle_length=30"
+    first = client.get(url)
+    second = client.get(url)
+    assert first.status_code == second.status_code == 200
+    assert first.headers["X-FastAPI-Cache"] == "MISS"
+    assert second.headers["X-FastAPI-Cache"] == "HIT"
+    assert first.json() == second.json()
+
+def test_day_info_etag(client: TestClient) -> None:
+    url = f"{settings.API_V1_STR}/cycle/day-info?query_date=2024-06-01&last_period_start_date=2024-05-20"
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.content == b""
+    other = client.get(f"{url}&cycle_length=30", headers={"If-None-Match": etag})
+    assert other.status_code == 200
+    assert other.headers["ETag"] != etag
+    assert response.headers["Cache-Control"] == "private, max-age=3600"
+    wildcard = client.get(url, headers={"If-None-Match": "*"})
+    assert wildcard.status_code == 304
+    assert wildcard.headers["ETag"] == etag
+    assert wildcard.content == b""
+
+def test_day_info_etag_wildcard_keeps_errors(client: TestClient) -> None:
+    future_date = date.today().replace(year=date.today().year + 1).isoformat()
+    url = f"{settings.API_V1_STR}/cycle/day-info"
+    for query, status_code in (
+        ("cycle_length=40", 422),
+        ("cycle_length=abc", 422),
+        (f"last_period_start_date={future_date}", 400),
+    ):
+        response = client.get(f"{url}?{query}", headers={"If-None-Match": "*"})
+        assert response.status_code == status_code
+        assert "ETag" not in response.headers
+
+def test_day_info_etag_repeated_keys(client: TestClient) -> None:
+    url = f"{settings.API_V1_STR}/cycle/day-info?query_date=2024-06-01&last_period_start_date=2024-05-18"
+    first = client.get(f"{url}&cycle_length=28&cycle_length=35")
+    second = client.get(f"{url}&cycle_length=35&cycle_length=28")
+    assert first.json()["phase"] != second.json()["phase"]
+    assert first.headers["ETag"] != second.headers["ETag"]
+    swapped = client.get(f"{url}&cycle_length=35&cycle_length=28", headers={"If-None-Match": first.headers["ETag"]})
+    assert swapped.status_code == 200
+
+def test_day_info_etag_default_dates_expire_at_midnight(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    class LateEvening(datetime):
+        @classmethod
+        def now(cls, tz: tzinfo | None = None) -> "LateEvening":
+            return cls.combine(datetime.now(timezone.utc).date(), time(23, 30), tz)
+
+    monkeypatch.setattr("app.main.datetime", LateEvening)
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-info")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, max-age=1800"
+    explicit = client.get(f"{settings.API_V1_STR}/cycle/day-info?query_date=2024-06-01&last_period_start_date=2024-05-20")
+    assert explicit.headers["Cache-Control"] == "private, max-age=3600"
+
+def test_day_range(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-range?start_date=2024-03-01&end_date=2024-03-31&last_period_start_date=2024-03-01")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 31
+    assert [day["cycleDay"] for day in data] == list(range(1, 29)) + [1, 2, 3]
+    assert data[0]["date"] == "2024-03-01"
+    assert data[-1]["date"] == "2024-03-31"
+    for day in data:
+        single = client.get(f"{settings.API_V1_STR}/cycle/day-info?query_date={day['date']}&last_period_start_date=2024-03-01")
+        assert single.json() == day
+
+def test_day_range_end_before_start(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-range?start_date=2024-03-10&end_date=2024-03-01&last_period_start_date=2024-03-01")
+    assert response.status_code == 400
+
+def test_day_range_too_long(client: TestClient) -> None:
+    response = client.get(f"{settings.API_V1_STR}/cycle/day-range?start_date=2024-01-01&end_date=2025-12-31&last_period_start_date=2024-01-01")
+    assert response.status_code == 400
+
+def test_day_range_max_span(client: TestClient) -> None:
+    # 2024 is a leap year: Jan 1 to Dec 31 is exactly 366 days, one more day is over the limit
+    url = f"{settings.API_V1_STR}/cycle/day-range?start_date=2024-01-01&last_period_start_date=2024-01-01"
+    response = client.get(f"{url}&end_date=2024-12-31")
+    assert response.status_code == 200
+    assert len(response.json()) == 366
+    response = client.get(f"{url}&end_date=2025-01-01")
+    assert response.status_code == 400
@@ -0,0 +1,18 @@
+import asyncio
+
+from app.core.cache import LRUInMemoryBackend
+
+
+def test_lru_backend_evicts_least_recently_used() -> None:
+    async def scenario() -> None:
+        backend = LRUInMemoryBackend(max_size=2)
+        await backend.set("a", b"1", expire=60)
+        await backend.set("b", b"2", expire=60)
+        assert await backend.get("a") == b"1"
+        await backend.set("c", b"3", expire=60)
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") == b"1"
+        assert await backend.get("c") == b"3"
+
+    asyncio.run(scenario())
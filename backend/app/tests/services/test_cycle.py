@@ -0,0 +1,31 @@
+from datetime import date
+
+import pytest
+
+from app.services.cycle import PHASE_DETAILS_DUMPED, get_day_info, get_day_info_range
+
+
+def test_day_info_details_are_not_shared() -> None:
+    args = (date(2024, 3, 10), date(2024, 3, 1), 28, 5, True)
+    first = get_day_info(*args)
+    assert first.details is not None
+    first.details["energy"] = "changed"
+
+    second = get_day_info(*args)
+    assert second.details is not None
+    assert second.details["energy"] != "changed"
+    assert PHASE_DETAILS_DUMPED[second.phase]["energy"] == second.details["energy"]
+
+
+def test_day_info_range_details_are_not_shared() -> None:
+    days = get_day_info_range(
+        date(2024, 3, 10), date(2024, 3, 11), date(2024, 3, 1), 28, 5, True
+    )
+    assert days[0].details is not None and days[1].details is not None
+    assert days[0].details is not days[1].details
+    assert days[0].details is not PHASE_DETAILS_DUMPED[days[0].phase]
+
+
+def test_phase_details_dumped_is_read_only() -> None:
+    with pytest.raises(TypeError):
+        PHASE_DETAILS_DUMPED["luteal"]["energy"] = "changed"  # type: ignore[index]